@@ -1,31 +1,42 @@
 from __future__ import annotations
 
 import json
-from copy import deepcopy
-from typing import Any, Dict, List, Optional, Tuple, TypeVar, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
 
 import httpx
 
 from . import _utils as utils
 
+_json_loads: Callable[[bytes], Any]
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover
+    _json_loads = json.loads
+
 _T = TypeVar("_T")
 
+_POOL_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=30.0)
+
 
 class Request:
+    # params and headers are shallow copies of what the caller passed in; treat them as read-only once built
     def __init__(self, method: str, *paths: str, **kwargs: Any) -> None:
         self.method = method
         self.path = path_join(paths)
         self.content = kwargs.pop("content", None)
 
         params = kwargs.pop("params", {})
-        cleaned_params = {k: v for k, v in params.items() if v is not None}
-        self.params = deepcopy(cleaned_params)
-        self.headers = deepcopy(kwargs.pop("headers", {}))
+        self.params = {k: v for k, v in params.items() if v is not None}
+        self.headers = dict(kwargs.pop("headers", None) or ())
         self.json = kwargs.pop("json", None)
+        self.decode = kwargs.pop("decode", True)
 
 
 class Response:
-    def __init__(self, method: str, path: str, status: int, content: Any, headers: Dict[str, Any]):
+    def __init__(self, method: str, path: str, status: int, content: Any, headers: httpx.Headers):
         self.method = method
         self.path = path
         self.status = status
@@ -79,9 +90,11 @@ class Adapter:
             self._session = httpx.Client(
                 base_url=self._base_url,
                 timeout=self._timeout,
-                headers=self._headers.copy(),
+                headers=self._headers,
                 auth=self._auth,
                 follow_redirects=True,
+                http2=True,
+                limits=_POOL_LIMITS,
             )
         return self._session
 
@@ -117,9 +130,12 @@ class Adapter:
             http_response.close()
             body = None
         else:
-            body = http_response.read()
-            if http_response.headers.get("Content-Type") == "application/json":
-                body = json.loads(http_response.text)
+            # parse the raw bytes; going through ``text`` would decode the whole body to str first
+            raw = http_response.read()
+            if req.decode and http_response.headers.get("Content-Type", "").startswith("application/json"):
+                body = _json_loads(raw)
+            else:
+                body = raw
 
         utils.raise_for_status_error(http_response)
 
@@ -128,12 +144,23 @@ class Adapter:
             path=http_response.url.path,
             status=http_response.status_code,
             content=body,
-            headers=dict(http_response.headers),
+            headers=http_response.headers,
         )
 
 
 def path_join(path: Union[str, List[str], Tuple[str, ...]]) -> str:
+    parts: List[str] = []
+    _flatten_path(path, parts)
+    segments = [segment for p in parts for segment in p.split("/") if segment]
+    if not segments:
+        return "/"
+    last = parts[-1]
+    return "/" + "/".join(segments) + ("/" if not last or last.endswith("/") else "")
+
+
+def _flatten_path(path: Union[str, List[str], Tuple[str, ...]], parts: List[str]) -> None:
     if isinstance(path, (list, tuple)):
-        path = "".join(path_join(p) for p in path)
-    path = "/" + path
-    return path.replace("//", "/")
+        for p in path:
+            _flatten_path(p, parts)
+    else:
+        parts.append(path)
@@ -1,14 +1,16 @@
 import os
-import re
-import textwrap
+import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Optional, Tuple, Type, TypeVar, Union, cast
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Type, TypeVar, Union, cast
 
 import httpx
 
 from . import _errors
 
+# dataclass only accepts ``slots`` from python 3.10 onwards
+DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 def get_consul_address() -> str:
     addr = os.getenv("CONSUL_ADDR") or os.getenv("CONSUL_HTTP_ADDR")
@@ -31,28 +33,33 @@ def get_consul_token() -> Optional[str]:
 
 
 def raise_for_status_error(response: httpx.Response, allow_404: bool = True):
-    err = """There was an error in the request that was made to consul.
-    {0.status_code}: "{0.reason_phrase}" for url "{0.url}"
-    Response content: {0.text}
-    {1}"""
+    if not response.is_error or (response.status_code == 404 and allow_404):
+        return
 
-    meta = extract_meta(response.headers)
     if response.is_client_error:
         if response.status_code == 400:
-            raise _errors.BadRequest(err.format(response, meta))
+            raise _errors.BadRequest(_error_message(response))
         elif response.status_code == 401:
-            raise _errors.ACLDisabled(err.format(response, meta))
+            raise _errors.ACLDisabled(_error_message(response))
         elif response.status_code == 403:
-            raise _errors.Forbidden(err.format(response, meta))
+            raise _errors.Forbidden(_error_message(response))
         elif response.status_code == 404:
-            if not allow_404:
-                raise _errors.NotFound(err.format(response, meta))
+            raise _errors.NotFound(_error_message(response))
         elif response.status_code == 409:
             raise _errors.ConflictError()
         else:
-            raise _errors.RequestError(err.format(response, meta))
+            raise _errors.RequestError(_error_message(response))
     elif response.is_server_error:
-        raise _errors.ServerError(err.format(response, meta))
+        raise _errors.ServerError(_error_message(response))
+
+
+def _error_message(response: httpx.Response) -> str:
+    return (
+        "There was an error in the request that was made to consul.\n"
+        f'{response.status_code}: "{response.reason_phrase}" for url "{response.url}"\n'
+        f"Response content: {response.text}\n"
+        f"{extract_meta(response.headers)}"
+    )
 
 
 _KT = TypeVar("_KT")
@@ -62,25 +69,35 @@ _VT = TypeVar("_VT")
 def flatdict_to_dict(dct: Dict[Tuple[_KT, ...], _VT]) -> Dict[_KT, Union[_VT, Dict[_KT, _VT]]]:
     typ = cast(Type[Dict[_KT, _VT]], type(dct))
     result = cast(Dict[_KT, Union[_VT, Dict[_KT, _VT]]], typ())
+    # keys usually arrive sorted, so consecutive entries tend to share a parent; remember the last one
+    last_path: Tuple[_KT, ...] = ()
+    last_dict = result
     for key_tuple, value in dct.items():
-        current_dict: Dict[_KT, Union[_VT, Dict[_KT, _VT]]] = result
-        for prefix_key in key_tuple[:-1]:
-            current_dict = cast(Dict[_KT, Union[_VT, Dict[_KT, _VT]]], current_dict.setdefault(prefix_key, typ()))
-        current_dict[key_tuple[-1]] = value
+        path = key_tuple[:-1]
+        if path != last_path:
+            current_dict: Dict[_KT, Union[_VT, Dict[_KT, _VT]]] = result
+            for prefix_key in path:
+                current_dict = cast(Dict[_KT, Union[_VT, Dict[_KT, _VT]]], current_dict.setdefault(prefix_key, typ()))
+            last_path, last_dict = path, current_dict
+        last_dict[key_tuple[-1]] = value
 
     return result
 
 
-_CTS_1 = re.compile("(.)([A-Z][a-z]+)", re.ASCII)
-_CTS_2 = re.compile("([a-z0-9])([A-Z])", re.ASCII)
-
-
-def camel_to_snake(name: str) -> str:
-    name = re.sub(_CTS_1, r"\1_\2", name)
-    return re.sub(_CTS_2, r"\1_\2", name).lower()
+def flatten_paths(dct: Mapping[str, Any], separator: str = "/") -> Dict[str, Any]:
+    flat: Dict[str, Any] = {}
+    stack: List[Tuple[str, Mapping[str, Any]]] = [("", dct)]
+    while stack:
+        prefix, node = stack.pop()
+        for key, value in node.items():
+            path = prefix + key
+            flat[path] = value
+            if isinstance(value, Mapping):
+                stack.append((path + separator, value))
+    return flat
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Metadata:
     index: int
     known_leader: str
@@ -89,13 +106,12 @@ class Metadata:
     translate_addresses: bool
 
     def __str__(self) -> str:
-        return textwrap.dedent(
-            f"""
-            X-Consul-Index: {self.index}
-            X-Consul-KnownLeader: {self.known_leader}
-            X-Consul-LastContact: {self.last_contact}
-            X-Consul-Token: {self.token}
-            X-Consul-Translate-Addresses: {self.translate_addresses}"""
+        return (
+            f"X-Consul-Index: {self.index}\n"
+            f"X-Consul-KnownLeader: {self.known_leader}\n"
+            f"X-Consul-LastContact: {self.last_contact}\n"
+            f"X-Consul-Token: {self.token}\n"
+            f"X-Consul-Translate-Addresses: {self.translate_addresses}"
         )
 
     __repr__ = __str__
@@ -1,18 +1,20 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Optional, Union, overload
+from dataclasses import dataclass, fields, replace
+from typing import Any, Mapping, Optional, Union, overload
 
 import httpx
 from cbasyncio import AsyncerContextManager
-from pydantic import BaseModel
 
 from ._adapter import Adapter
 from ._auth import TokenAuth
+from ._utils import DATACLASS_SLOTS
 from .kv import KV, AsyncKV
 
 
-class Config(BaseModel):
+@dataclass(**DATACLASS_SLOTS)
+class Config:
     address: str
     token: Optional[str] = None
     timeout: Optional[int] = None
@@ -20,6 +22,30 @@ class Config(BaseModel):
     basic_auth: Optional[str] = None
     prefix: Optional[str] = None
 
+    @classmethod
+    def parse_obj(cls, obj: Mapping[str, Any]) -> Config:
+        return cls(**{f.name: obj[f.name] for f in fields(cls) if f.name in obj})
+
+
+def _getenv_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+_DEFAULT_CONFIG = Config(
+    address=os.getenv("CONSUL_HTTP_ADDR", "http://localhost:8500"),
+    token=os.getenv("CONSUL_HTTP_TOKEN"),
+    timeout=_getenv_int("CONSUL_HTTP_TIMEOUT", 5),
+    basic_auth=os.getenv("CONSUL_HTTP_AUTH"),
+    namespace=os.getenv("CONSUL_NAMESPACE"),
+)
+
+
+def _default_config(**overrides: Any) -> Config:
+    return replace(_DEFAULT_CONFIG, **{k: v for k, v in overrides.items() if v})
+
 
 class Consul:
     _adapter: Adapter
@@ -54,15 +80,15 @@ class Consul:
         namespace: Optional[str] = None,
         prefix: Optional[str] = None,
     ) -> None:
-        if isinstance(config, Config):
-            config = config
-        else:
-            address = config or os.getenv("CONSUL_HTTP_ADDR", "http://localhost:8500")
-            token = token or os.getenv("CONSUL_HTTP_TOKEN", None)
-            timeout = timeout or int(os.getenv("CONSUL_HTTP_TIMEOUT", 5))
-            basic_auth = basic_auth or os.getenv("CONSUL_HTTP_AUTH", None)
-            namespace = namespace or os.getenv("CONSUL_NAMESPACE", None)
-            config = Config(address=address, token=token, basic_auth=basic_auth)
+        if not isinstance(config, Config):
+            config = _default_config(
+                address=config,
+                token=token,
+                timeout=timeout,
+                basic_auth=basic_auth,
+                namespace=namespace,
+                prefix=prefix,
+            )
 
         if config.token:
             auth = TokenAuth(config.token)
@@ -72,7 +98,7 @@ class Consul:
             auth = None
 
         address = config.address.rstrip("/") + "/v1"
-        self._adapter = Adapter(base_url=address, auth=auth, namespace=namespace, timeout=config.timeout)
+        self._adapter = Adapter(base_url=address, auth=auth, namespace=config.namespace, timeout=config.timeout)
         self._kv = KV(self._adapter, prefix=config.prefix)
 
     @property
@@ -1,14 +1,46 @@
 from __future__ import annotations
 
 import contextlib
-from base64 import b64decode
-from dataclasses import asdict, dataclass, field, fields
-from typing import Any, Callable, Dict, Generic, Iterator, List, Literal, Mapping, Optional, Tuple, TypeVar, cast
+import threading
+from dataclasses import dataclass, field, fields
+from typing import (
+    Any,
+    AsyncIterable,
+    Callable,
+    Dict,
+    Generator,
+    Generic,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    TypeVar,
+    cast,
+)
 
 from cbasyncio import Asyncer
 
 from ._adapter import Adapter, Request
-from ._utils import camel_to_snake, flatdict_to_dict
+from ._utils import DATACLASS_SLOTS, flatdict_to_dict
+
+_b64decode: Callable[..., bytes]
+
+try:
+    import pybase64
+
+    _b64decode = pybase64.b64decode
+except ImportError:  # pragma: no cover
+    import base64
+
+    _b64decode = base64.b64decode
+
+simdjson: Any
+
+try:
+    import simdjson
+except ImportError:  # pragma: no cover
+    simdjson = None
 
 _T = TypeVar("_T")
 
@@ -17,6 +49,7 @@ class KV:
     def __init__(self, adapter: Adapter, *, prefix: Optional[str] = None) -> None:
         self._adapter = adapter
         self._prefix = prefix
+        self._local = threading.local()
 
     @property
     def prefix(self) -> Optional[str]:
@@ -36,6 +69,12 @@ class KV:
     def get_records(self, prefix: str, *, recurse: bool = False, separator: str = "/") -> List[Record]:
         return self.apply(Operation.get_tree(prefix, recurse=recurse, separator=separator))
 
+    def iter_records(self, prefix: str, *, recurse: bool = False, separator: str = "/") -> Iterator[Record]:
+        op = Operation.get_tree(prefix, recurse=recurse, separator=separator)
+        # the parsed document has to outlive the returned generator, which the caller may suspend at any
+        # point, so it gets its own parser rather than borrowing the per-thread one
+        return self._iter_records(op, simdjson.Parser() if simdjson is not None else None)
+
     def get_tree(
         self,
         prefix: str,
@@ -46,15 +85,15 @@ class KV:
     ) -> Dict[str, Any]:
         prefix = prefix + separator if not prefix.endswith(separator) else prefix
         index = prefix.count(separator)
-        records = self.get_records(prefix, recurse=recurse, separator=separator)
-        tree = flatdict_to_dict(
-            {
-                tuple(record.key.split(separator)[index:]): b64decode(record.value).decode("utf-8")
-                if record.value is not None
-                else None
-                for record in records
-            }
-        )
+        op = Operation.get_tree(prefix, recurse=recurse, separator=separator)
+        records = self._iter_records(op, self._parser())
+        try:
+            tree = flatdict_to_dict(
+                {tuple(record.key.split(separator)[index:]): _decode_value(record.value) for record in records}
+            )
+        finally:
+            # release the parsed document even on error so the per-thread parser can be reused
+            records.close()
         if key_transform is not None:
             tree = {key_transform(k): v for k, v in tree.items()}
         return tree
@@ -85,14 +124,42 @@ class KV:
         return self.apply(Operation.delete_tree(prefix))
 
     def apply(self, op: Operation[_T], default: Optional[_T] = None) -> _T:
-        key = self.prefix or "" + op.key
-        request = Request(_get_method(op), "kv", key, params=op.params_dict(), content=op.value)
-        response = self._adapter.request(request)
-        if response.content is None:
+        content = self._send(op)
+        if content is None:
             if default is None:
                 raise KeyError(op.key)
             return default
-        return cast(_T, _decode_content(op, response.content))
+        if _is_bulk(op):
+            return cast(_T, self._parse_records(content))
+        return cast(_T, _decode_content(op, content))
+
+    def _send(self, op: Operation) -> Any:
+        key = (self.prefix or "") + op.key
+        bulk = _is_bulk(op)
+        request = Request(_get_method(op), "kv", key, params=op.params_dict(), content=op.value, decode=not bulk)
+        return self._adapter.request(request).content
+
+    def _iter_records(self, op: Operation, parser: Any) -> Generator[Record, None, None]:
+        content = self._send(op)
+        if content is None:
+            raise KeyError(op.key)
+        if _is_bulk(op):
+            yield from _iter_parsed_records(parser, content)
+        else:
+            yield from map(_to_record, content)
+
+    def _parse_records(self, body: bytes) -> List[Record]:
+        return list(_iter_parsed_records(self._parser(), body))
+
+    def _parser(self) -> Any:
+        # simdjson parsers reuse their buffers between documents but are not thread safe, and AsyncKV
+        # runs requests on worker threads, so keep one parser per thread
+        if simdjson is None:
+            return None
+        parser = getattr(self._local, "parser", None)
+        if parser is None:
+            parser = self._local.parser = simdjson.Parser()
+        return parser
 
 
 class AsyncKV(Asyncer[KV]):
@@ -107,6 +174,9 @@ class AsyncKV(Asyncer[KV]):
     async def get_records(self, prefix: str, *, recurse: bool = False, separator: str = "/") -> List[Record]:
         return await self.run_sync(self.raw.get_records, prefix, recurse=recurse, separator=separator)
 
+    def iter_records(self, prefix: str, *, recurse: bool = False, separator: str = "/") -> AsyncIterable[Record]:
+        return self.iterate(self.raw.iter_records(prefix, recurse=recurse, separator=separator))
+
     async def get_tree(
         self,
         prefix: str,
@@ -163,17 +233,24 @@ Verb = Literal[
 ]
 
 
+_VERB_METHOD: Dict[str, str] = {
+    "delete": "DELETE",
+    "delete-cas": "DELETE",
+    "delete-tree": "DELETE",
+    "set": "PUT",
+    "cas": "PUT",
+    "lock": "PUT",
+    "unlock": "PUT",
+    "acquire": "PUT",
+    "release": "PUT",
+}
+
+
 def _get_method(op: Operation) -> str:
-    return (
-        "DELETE"
-        if op.verb in ("delete-cas", "delete-tree", "delete")
-        else "PUT"
-        if op.verb in ("set", "cas", "lock", "unlock")
-        else "GET"
-    )
+    return _VERB_METHOD.get(op.verb, "GET")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Operation(Generic[_T]):
     verb: Verb
     key: str
@@ -191,12 +268,7 @@ class Operation(Generic[_T]):
     release: Optional[str] = field(default=None)
 
     def params_dict(self) -> Dict[str, Any]:
-        exportable = set(f.name for f in fields(self)).difference(("verb", "key", "value"))
-
-        def export(items: List[Tuple[str, Any]]) -> Dict[str, Any]:
-            return dict((k, v) for k, v in items if k in exportable and v is not None)
-
-        return asdict(self, dict_factory=export)
+        return {name: value for name in _OP_EXPORT_FIELDS if (value := getattr(self, name)) is not None}
 
     @staticmethod
     def get(key: str, *, raw: Optional[bool] = None) -> Operation[Record]:
@@ -239,15 +311,36 @@ class Operation(Generic[_T]):
         return Operation("delete-tree", prefix, recurse=True)
 
 
+_OP_EXPORT_FIELDS = tuple(f.name for f in fields(Operation) if f.name not in ("verb", "key", "value"))
+
+
+def _is_bulk(op: Operation) -> bool:
+    return simdjson is not None and op.verb == "get-tree" and not op.keys
+
+
+def _decode_value(value: Optional[str]) -> Optional[str]:
+    return _b64decode(value, validate=False).decode("utf-8") if value is not None else None
+
+
+def _iter_parsed_records(parser: Any, body: bytes) -> Iterator[Record]:
+    for item in parser.parse(body):
+        yield _to_record(item)
+
+
 def _decode_content(op: Operation, content: Any):
     if isinstance(content, (bool, str, bytes)):
         return content
     if isinstance(content, (list, set, tuple)):
-        if all(isinstance(o, str) for o in content):
+        # consul never mixes types within a listing, so the first element decides how to decode the rest
+        first = next(iter(content), None)
+        if first is None or isinstance(first, str):
             return cast(List[str], list(content))
-        if all(isinstance(o, Mapping) for o in content):
+        if isinstance(first, Mapping):
             c = cast(List[Dict[str, Any]], content)
-            content_list = [Record(**{camel_to_snake(k): v for k, v in o.items()}) for o in c]
+            try:
+                content_list = [_to_record(o) for o in c]
+            except AttributeError:
+                return None
             if op.verb in ("get", "watch"):
                 return next(iter(content_list), content_list)
             return content_list
@@ -255,7 +348,19 @@ def _decode_content(op: Operation, content: Any):
     return None
 
 
-@dataclass
+def _to_record(o: Mapping[str, Any]) -> Record:
+    return Record(
+        key=o.get("Key", ""),
+        create_index=o.get("CreateIndex", 0),
+        modify_index=o.get("ModifyIndex", 0),
+        lock_index=o.get("LockIndex", 0),
+        flags=o.get("Flags", 0),
+        value=o.get("Value", ""),
+        session=o.get("Session", ""),
+    )
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Record:
     key: str
     create_index: int = 0
@@ -1,4 +1,4 @@
-import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 
 import dpath.util
@@ -6,7 +6,12 @@ from pydantic import BaseModel
 from pydantic.fields import ModelField
 from pydantic.utils import deep_update
 
-from .consul import Config, Consul
+from ._utils import flatten_paths
+from .consul import Config, Consul, _default_config
+
+
+_GLOB_CHARS = frozenset("*?[")
+_MAX_WORKERS = 8
 
 
 class ConsulSource:
@@ -29,12 +34,12 @@ class ConsulSource:
         self.paths = paths
 
         if not consul_config:
-            consul_config = Config(
-                address=consul_address or os.getenv("CONSUL_HTTP_ADDR", "http://localhost:8500"),
-                token=consul_token or os.getenv("CONSUL_HTTP_TOKEN", None),
-                timeout=consul_timeout or int(os.getenv("CONSUL_HTTP_TIMEOUT", 5)),
-                basic_auth=consul_basic_auth or os.getenv("CONSUL_HTTP_AUTH", None),
-                namespace=consul_namespace or os.getenv("CONSUL_NAMESPACE", None),
+            consul_config = _default_config(
+                address=consul_address,
+                token=consul_token,
+                timeout=consul_timeout,
+                basic_auth=consul_basic_auth,
+                namespace=consul_namespace,
             )
 
         self.config = consul_config
@@ -46,18 +51,26 @@ class ConsulSource:
         result: Dict[str, Any] = {}
 
         xform = str.lower if not self.case_sensitive else lambda x: x
-        with Consul(self.config) as client:
-            tree = deep_update(*(client.kv.get_tree(key, recurse=True, key_transform=xform) for key in self.paths))
+        with Consul(self.config) as client, ThreadPoolExecutor(max_workers=min(len(self.paths), _MAX_WORKERS)) as pool:
+            trees = pool.map(lambda key: client.kv.get_tree(key, recurse=True, key_transform=xform), self.paths)
+            tree = deep_update(*trees)
+        paths = flatten_paths(tree, separator="/")
 
         for field in model.__fields__.values():
             for name in map(xform, _get_source_names(field, "consul")):
-                if value := dpath.util.get(tree, name, separator="/", default=None):
+                if value := _lookup(tree, paths, name):
                     result[field.alias] = value
                     break
 
         return result
 
 
+def _lookup(tree: Dict[str, Any], paths: Dict[str, Any], name: str, separator: str = "/") -> Any:
+    if _GLOB_CHARS.intersection(name):
+        return dpath.util.get(tree, name, separator=separator, default=None)
+    return paths.get(name.lstrip(separator))
+
+
 def _get_source_names(field: ModelField, extra: str, *, transform: Optional[Callable[[str], str]] = None) -> List[str]:
     source_names: Union[str, Iterable[str]] = field.field_info.extra.get(extra, field.name)
     if isinstance(source_names, str):